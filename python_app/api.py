@@ -1,13 +1,116 @@
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Optional, List
-from models import CombinedLead, LeadsFilters, LeadStats, LeadSource, SortBy, SortOrder
+import json
+import os
+from datetime import date
+import threading
+import time
+from models import TimeInterval, TimeseriesDimension, TimeseriesPoint, ReadinessStatus, LeadBatchRequest, LeadBatchResponse, CombinedLead, LeadsFilters, LeadStats, LeadSource, SortBy, SortOrder, SkillMatch, SkillCount
 from database import SQLiteDatabase
 
 app = FastAPI(title="Lead Management API", version="1.0.0")
 
-# Initialize database
-db = SQLiteDatabase("../data/leads.db")
+# Initialize database. Setting LEADS_SNAPSHOT_DIR serves reads from
+# periodically refreshed read-only snapshots instead of the live file.
+# LEADS_SNAPSHOT_MAX_STALENESS also bounds how far the skill index and
+# lead rollup may lag the live tables.
+db = SQLiteDatabase(
+    os.environ.get("LEADS_DB_PATH", "../data/leads.db"),
+    snapshot_dir=os.environ.get("LEADS_SNAPSHOT_DIR") or None,
+    max_staleness=float(os.environ.get("LEADS_SNAPSHOT_MAX_STALENESS", "30"))
+)
+
+# Warm-up state reported by /api/ready
+readiness = ReadinessStatus(
+    ready=False, database=False, skillIndex=False, leadRollup=False, snapshot=False
+)
+
+# Backoff between warm-up attempts, doubling up to the cap
+WARM_UP_RETRY_DELAY = 1.0
+WARM_UP_MAX_RETRY_DELAY = 30.0
+
+def warm_up():
+    """Retry warm-up with backoff; a locked database at boot is common"""
+    delay = WARM_UP_RETRY_DELAY
+    while True:
+        try:
+            db.check_connection()
+            readiness.database = True
+            db.sync_skill_index()
+            readiness.skillIndex = True
+            db.sync_lead_rollup()
+            readiness.leadRollup = True
+            if db.snapshot_dir:
+                db.refresh_snapshot()
+                readiness.snapshot = True
+            readiness.error = None
+            readiness.ready = True
+            break
+        except Exception as e:
+            readiness.error = str(e)
+            time.sleep(delay)
+            delay = min(delay * 2, WARM_UP_MAX_RETRY_DELAY)
+    
+    keep_fresh()
+
+def keep_fresh():
+    """Sync the skill index and rollup every max_staleness/2 seconds (and
+    refresh the snapshot in snapshot mode); failures keep the last data serving"""
+    while True:
+        time.sleep(db.max_staleness / 2)
+        try:
+            db.sync_skill_index()
+            db.sync_lead_rollup()
+            if db.snapshot_dir:
+                db.refresh_snapshot()
+            readiness.error = None
+        except Exception as e:
+            readiness.error = str(e)
+
+@app.on_event("startup")
+async def start_warm_up():
+    """Warm up in the background so the server accepts connections immediately"""
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+
+@app.get("/api/ready", response_model=ReadinessStatus)
+async def get_readiness():
+    """Report whether the database, skill index, lead rollup and snapshot are ready to serve"""
+    status = readiness.model_copy(update={
+        "dataVersion": db.data_version,
+        "dataAgeSeconds": db.snapshot_age()
+    })
+    if status.dataAgeSeconds is not None and status.dataAgeSeconds > db.max_staleness:
+        status.ready = False
+    status_code = 200 if status.ready else 503
+    return JSONResponse(status_code=status_code, content=status.model_dump())
+
+@app.middleware("http")
+async def pin_data_version(request, call_next):
+    """Serve each request from one snapshot and report which in X-Data-Version.
+    
+    The snapshot stays acquired until the response body has been sent, so
+    streaming responses can keep opening connections to it.
+    """
+    snapshot = db.acquire_snapshot()
+    try:
+        with db.pinned_snapshot(snapshot):
+            response = await call_next(request)
+            response.headers["X-Data-Version"] = db.data_version
+    except Exception:
+        db.release_snapshot(snapshot)
+        raise
+    
+    body_iterator = response.body_iterator
+    async def release_after_body():
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            db.release_snapshot(snapshot)
+    
+    response.body_iterator = release_after_body()
+    return response
 
 @app.get("/api/leads", response_model=List[CombinedLead])
 async def get_leads(
@@ -15,6 +118,8 @@ async def get_leads(
     school: Optional[str] = Query(None),
     country: Optional[str] = Query(None),
     source: Optional[LeadSource] = Query(None),
+    skills: Optional[List[str]] = Query(None),
+    skillsMatch: Optional[SkillMatch] = Query(None),
     sortBy: Optional[SortBy] = Query(None),
     sortOrder: Optional[SortOrder] = Query(None)
 ):
@@ -25,6 +130,8 @@ async def get_leads(
             school=school,
             country=country,
             source=source,
+            skills=skills,
+            skillsMatch=skillsMatch,
             sortBy=sortBy,
             sortOrder=sortOrder
         )
@@ -33,6 +140,30 @@ async def get_leads(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/leads/batch", response_model=LeadBatchResponse)
+def get_leads_batch(request: LeadBatchRequest):
+    """Look up many leads at once, streamed back in request order"""
+    # Errors after the first chunk is sent can't change the status code,
+    # so surface an unusable database as a 500 before streaming starts
+    try:
+        db.check_connection()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    def stream():
+        missing = []
+        separator = ""
+        yield '{"leads": ['
+        for uid, lead in db.iter_leads_by_uids(request.uids):
+            if lead is None:
+                missing.append(uid)
+                continue
+            yield separator + lead.model_dump_json()
+            separator = ","
+        yield '], "missing": ' + json.dumps(missing) + '}'
+    
+    return StreamingResponse(stream(), media_type="application/json")
+
 @app.get("/api/leads/{uid}", response_model=CombinedLead)
 async def get_lead_by_uid(uid: str):
     """Get a specific lead by UID"""
@@ -71,6 +202,40 @@ async def get_unique_countries():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/skills", response_model=List[SkillCount])
+async def get_top_skills(limit: int = Query(50, ge=1, le=1000)):
+    """Get the most common skills with lead counts"""
+    try:
+        skills = db.get_top_skills(limit)
+        return skills
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/analytics/timeseries", response_model=List[TimeseriesPoint])
+async def get_lead_timeseries(
+    interval: TimeInterval = Query(TimeInterval.DAY),
+    groupBy: Optional[List[TimeseriesDimension]] = Query(None),
+    start: Optional[date] = Query(None, description="First day (YYYY-MM-DD), inclusive"),
+    end: Optional[date] = Query(None, description="Last day (YYYY-MM-DD), inclusive"),
+    source: Optional[LeadSource] = Query(None),
+    school: Optional[str] = Query(None),
+    country: Optional[str] = Query(None)
+):
+    """Get lead inflow per day or week, optionally split by source, school and country"""
+    try:
+        points = db.get_lead_timeseries(
+            interval=interval,
+            group_by=groupBy,
+            start=start.isoformat() if start else None,
+            end=end.isoformat() if end else None,
+            source=source,
+            school=school,
+            country=country
+        )
+        return points
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -1,14 +1,11 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
 from typing import Optional, List, Dict, Any
-import json
 from datetime import datetime
-import base64
-import io
+
+# pandas and plotly.graph_objects are imported inside the methods that use
+# them. pandas is only needed for CSV export, so the first run skips it;
+# recent Streamlit releases load plotly.graph_objects themselves at startup
 
 # Set page config
 st.set_page_config(
@@ -128,6 +125,19 @@ class LeadManagementApp:
         data = self.make_request("/api/countries")
         return data if isinstance(data, list) else []
     
+    def get_top_skills(self, limit: int = 100) -> List[Dict]:
+        """Get most common skills with counts"""
+        data = self.make_request("/api/skills", {"limit": limit})
+        return data if isinstance(data, list) else []
+    
+    def get_lead_timeseries(self, interval: str = "week") -> List[Dict]:
+        """Get lead inflow over time split by source"""
+        data = self.make_request(
+            "/api/analytics/timeseries",
+            {"interval": interval, "groupBy": "source"}
+        )
+        return data if isinstance(data, list) else []
+    
     def get_lead_by_uid(self, uid: str) -> Dict:
         """Get specific lead by UID"""
         return self.make_request(f"/api/leads/{uid}")
@@ -184,6 +194,8 @@ class LeadManagementApp:
         """Render statistics chart"""
         if not stats:
             return
+        
+        import plotly.graph_objects as go
             
         # Create pie chart
         labels = ['Schools Only', 'Sales Navigator', 'Both Sources']
@@ -212,7 +224,40 @@ class LeadManagementApp:
         
         st.plotly_chart(fig, use_container_width=True)
     
-    def render_filters(self, schools: List[str], countries: List[str]) -> Dict:
+    def render_timeseries_chart(self, points: List[Dict], interval: str):
+        """Render stacked lead inflow chart by source"""
+        if not points:
+            st.info("No timestamped leads yet.")
+            return
+        
+        import plotly.graph_objects as go
+        
+        sources = [
+            ('schools', 'Schools Only', '#10b981'),
+            ('salesnav', 'Sales Navigator', '#f59e0b'),
+            ('both', 'Both Sources', '#8b5cf6'),
+        ]
+        
+        fig = go.Figure()
+        for source, label, color in sources:
+            source_points = [point for point in points if point.get('source') == source]
+            fig.add_trace(go.Bar(
+                x=[point['period'] for point in source_points],
+                y=[point['count'] for point in source_points],
+                name=label,
+                marker_color=color
+            ))
+        
+        fig.update_layout(
+            title=f"New Leads per {interval.capitalize()}",
+            barmode='stack',
+            font=dict(size=14),
+            height=400
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def render_filters(self, schools: List[str], countries: List[str], skills: List[Dict]) -> Dict:
         """Render filter controls"""
         st.subheader("🔍 Filter Leads")
         
@@ -233,12 +278,21 @@ class LeadManagementApp:
             source_options = ["All", "schools", "salesnav", "both"]
             source = st.selectbox("Source", source_options)
         
-        # Sorting options
-        col5, col6 = st.columns(2)
+        # Skill options
+        col5, col6 = st.columns([3, 1])
         with col5:
-            sort_by = st.selectbox("Sort by", ["name", "title", "location", "timestamp"])
+            skill_options = [skill['skill'] for skill in skills]
+            selected_skills = st.multiselect("Skills", skill_options)
         
         with col6:
+            skills_match = st.selectbox("Match", ["any", "all"])
+        
+        # Sorting options
+        col7, col8 = st.columns(2)
+        with col7:
+            sort_by = st.selectbox("Sort by", ["name", "title", "location", "timestamp"])
+        
+        with col8:
             sort_order = st.selectbox("Order", ["asc", "desc"])
         
         return {
@@ -246,6 +300,8 @@ class LeadManagementApp:
             "school": school if school != "All" else None,
             "country": country if country != "All" else None,
             "source": source if source != "All" else None,
+            "skills": selected_skills if selected_skills else None,
+            "skillsMatch": skills_match if selected_skills else None,
             "sortBy": sort_by,
             "sortOrder": sort_order
         }
@@ -349,6 +405,8 @@ class LeadManagementApp:
         if not leads:
             return ""
         
+        import pandas as pd
+        
         df = pd.DataFrame(leads)
         
         # Select relevant columns
@@ -411,6 +469,7 @@ class LeadManagementApp:
         stats = self.get_lead_stats()
         schools = self.get_unique_schools()
         countries = self.get_unique_countries()
+        skills = self.get_top_skills()
         
         # Render stats
         if stats:
@@ -429,9 +488,14 @@ class LeadManagementApp:
                 st.write(f"Schools Only: {stats.get('schoolsOnly', 0)}")
                 st.write(f"Sales Navigator: {stats.get('salesnavOnly', 0)}")
                 st.write(f"Both Sources: {stats.get('both', 0)}")
+            
+            # Inflow section
+            st.subheader("📈 Lead Inflow")
+            interval = st.radio("Interval", ["week", "day"], horizontal=True)
+            self.render_timeseries_chart(self.get_lead_timeseries(interval), interval)
         
         # Filters
-        filters = self.render_filters(schools, countries)
+        filters = self.render_filters(schools, countries, skills)
         
         # Get filtered leads
         leads = self.get_leads(filters)
@@ -1,31 +1,328 @@
+import contextvars
+import glob
+import os
 import sqlite3
-from typing import List, Optional, Dict, Any
-from models import CombinedLead, LeadsFilters, LeadStats, LeadSource
+import string
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterator, Tuple, NamedTuple
+from models import (
+    CombinedLead, LeadsFilters, LeadStats, LeadSource, SkillMatch, SkillCount,
+    TimeInterval, TimeseriesDimension, TimeseriesPoint
+)
+from lead_store import CompactLeadStore, LeadRecord
+
+class BackupRestartedError(Exception):
+    """A paged backup kept restarting because the source was being written"""
+
+class Snapshot(NamedTuple):
+    version: str
+    path: str
+    created_at: datetime
+    # Last time the live file was seen unchanged since this copy was taken
+    checked_at: datetime
+    # (mtime, size) of the live file and its WAL when the copy was taken
+    source_signature: Tuple
 
 class SQLiteDatabase:
-    def __init__(self, db_path: str):
+    # Stay well under SQLite's default bound-parameter limit
+    UID_CHUNK_SIZE = 500
+    
+    # Salesnav rows after a rowid whose skills/experience changed since indexing
+    CHANGED_PROFILES_QUERY = """
+        SELECT n.rowid AS rowid, n.uid, n.skills, n.experience FROM leads_salesnav n
+        LEFT JOIN lead_profile_index p ON p.uid = n.uid
+        WHERE n.rowid > ?
+          AND (p.uid IS NULL
+               OR p.skills_raw IS NOT n.skills
+               OR p.experience_raw IS NOT n.experience)
+        ORDER BY n.rowid
+        LIMIT ?
+    """
+    NOCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+    
+    # Rollup columns backing each timeseries dimension
+    TIMESERIES_COLUMNS = {
+        TimeseriesDimension.SOURCE: "source",
+        TimeseriesDimension.SCHOOL: "req_school",
+        TimeseriesDimension.COUNTRY: "req_country",
+    }
+    
+    # Snapshot files kept alongside the current one for in-flight requests
+    SNAPSHOTS_TO_KEEP = 3
+    
+    # Rollback-journal sources are copied this many pages per step with a
+    # sleep in between, so the scraper can commit while a snapshot is made.
+    # Every such commit restarts the copy, so after BACKUP_MAX_RESTARTS it
+    # falls back to a single-step copy.
+    BACKUP_PAGES_PER_STEP = 1024
+    BACKUP_STEP_SLEEP = 0.005
+    BACKUP_MAX_RESTARTS = 3
+    
+    def __init__(self, db_path: str, snapshot_dir: Optional[str] = None, max_staleness: float = 30.0):
         self.db_path = db_path
+        # When set, reads are served from read-only copies of db_path made
+        # with the SQLite backup API instead of the live file the scraper writes
+        self.snapshot_dir = snapshot_dir
+        self.max_staleness = max_staleness
+        self._snapshot: Optional[Snapshot] = None
+        self._pinned: contextvars.ContextVar[Optional[Snapshot]] = contextvars.ContextVar("pinned_snapshot", default=None)
+        self._refresh_lock = threading.Lock()
+        # Open requests per snapshot path; pinned files are never pruned
+        self._pins: Dict[str, int] = {}
+        self._pins_lock = threading.Lock()
+        # Serializes index/rollup syncs within the process; BEGIN IMMEDIATE
+        # covers other processes writing the same derived tables
+        self._sync_lock = threading.Lock()
+        self._ensured = set()
     
     def get_connection(self):
+        """Connection for reads: the pinned or current snapshot if there is one"""
+        snapshot = self._pinned.get() or self._snapshot
+        if snapshot is None:
+            return self.get_live_connection()
+        return sqlite3.connect(Path(snapshot.path).as_uri() + "?mode=ro", uri=True)
+    
+    def get_live_connection(self):
+        """Connection to the live database, used for index maintenance"""
         return sqlite3.connect(self.db_path)
     
+    @property
+    def data_version(self) -> str:
+        snapshot = self._pinned.get() or self._snapshot
+        return snapshot.version if snapshot else "live"
+    
+    def snapshot_age(self) -> Optional[float]:
+        if self._snapshot is None:
+            return None
+        return (datetime.now(timezone.utc) - self._snapshot.checked_at).total_seconds()
+    
+    def acquire_snapshot(self) -> Optional[Snapshot]:
+        """Take the current snapshot and keep its file until release_snapshot()"""
+        with self._pins_lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                self._pins[snapshot.path] = self._pins.get(snapshot.path, 0) + 1
+            return snapshot
+    
+    def release_snapshot(self, snapshot: Optional[Snapshot]):
+        if snapshot is None:
+            return
+        with self._pins_lock:
+            self._pins[snapshot.path] -= 1
+            if not self._pins[snapshot.path]:
+                del self._pins[snapshot.path]
+                if snapshot.path != self._snapshot.path:
+                    self._prune_snapshots()
+    
+    @contextmanager
+    def pinned_snapshot(self, snapshot: Optional[Snapshot]):
+        """Serve every read inside the block from an acquired snapshot"""
+        token = self._pinned.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            self._pinned.reset(token)
+    
+    def refresh_snapshot(self) -> Snapshot:
+        """Copy the live database into a new snapshot file and swap it in.
+        
+        Skipped when the live file and its WAL are unchanged since the current
+        snapshot was taken; the snapshot is then only marked as checked. The
+        copy is written under a temporary name and renamed into place before
+        the swap, so readers only ever see complete snapshots. Connections
+        already open on an older snapshot keep reading it.
+        """
+        with self._refresh_lock:
+            now = datetime.now(timezone.utc)
+            signature = self._live_signature()
+            if self._snapshot and self._snapshot.source_signature == signature:
+                self._snapshot = self._snapshot._replace(checked_at=now)
+                return self._snapshot
+            
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            version = now.strftime("%Y%m%dT%H%M%S%fZ")
+            path = os.path.join(self.snapshot_dir, f"leads.{version}.db")
+            tmp_path = path + ".tmp"
+            
+            live = self.get_live_connection()
+            target = sqlite3.connect(tmp_path)
+            try:
+                self._backup(live, target)
+                # The copy inherits WAL mode from a WAL source; switch back so
+                # read-only opens don't leave -wal/-shm files next to it
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+                live.close()
+            os.replace(tmp_path, path)
+            
+            with self._pins_lock:
+                self._snapshot = Snapshot(version, path, now, now, signature)
+                self._prune_snapshots()
+            return self._snapshot
+    
+    def _backup(self, live: sqlite3.Connection, target: sqlite3.Connection):
+        # WAL readers don't block the writer, so copy in one step
+        if live.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal":
+            live.backup(target)
+            return
+        
+        state = {"remaining": None, "restarts": 0}
+        def progress(status, remaining, total):
+            # remaining only grows when a write elsewhere restarted the copy
+            if state["remaining"] is not None and remaining > state["remaining"]:
+                state["restarts"] += 1
+                if state["restarts"] > self.BACKUP_MAX_RESTARTS:
+                    raise BackupRestartedError()
+            state["remaining"] = remaining
+        
+        try:
+            live.backup(
+                target,
+                pages=self.BACKUP_PAGES_PER_STEP,
+                progress=progress,
+                sleep=self.BACKUP_STEP_SLEEP
+            )
+        except BackupRestartedError:
+            live.backup(target)
+    
+    def _live_signature(self) -> Tuple:
+        signature = []
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _prune_snapshots(self):
+        # Called with _pins_lock held; pinned snapshots go once their last release
+        paths = sorted(glob.glob(os.path.join(self.snapshot_dir, "leads.*.db")))
+        for path in paths[:-self.SNAPSHOTS_TO_KEEP]:
+            if path in self._pins:
+                continue
+            for sidecar in ("", "-wal", "-shm", "-journal"):
+                try:
+                    os.remove(path + sidecar)
+                except OSError:
+                    pass
+    
+    def check_connection(self):
+        """Raise if the leads tables can't be queried on the read path"""
+        conn = self.get_connection()
+        try:
+            conn.execute("SELECT 1 FROM leads_schools LIMIT 1").fetchall()
+            conn.execute("SELECT 1 FROM leads_salesnav LIMIT 1").fetchall()
+        finally:
+            conn.close()
+    
     def get_leads(self, filters: Optional[LeadsFilters] = None) -> List[CombinedLead]:
         conn = self.get_connection()
         conn.row_factory = sqlite3.Row
         
         try:
-            # Get all leads from both tables
-            schools_query = "SELECT *, 'schools' as source_table FROM leads_schools"
-            salesnav_query = "SELECT *, 'salesnav' as source_table FROM leads_salesnav"
+            schools_query, salesnav_query, params = self._lead_queries(filters)
+            schools_leads = conn.execute(schools_query, params).fetchall()
+            salesnav_leads = conn.execute(salesnav_query, params).fetchall()
+            
+            unique_leads = self._merge_rows(schools_leads, salesnav_leads)
+            
+            # Convert to CombinedLead objects
+            leads = [CombinedLead(**lead_data) for lead_data in unique_leads.values()]
+            
+            # Apply filters
+            if filters:
+                leads = self._apply_filters(leads, filters)
+            
+            return leads
+            
+        finally:
+            conn.close()
+    
+    def get_leads_compact(self, filters: Optional[LeadsFilters] = None) -> List[LeadRecord]:
+        """Like get_leads, but returns slotted LeadRecords built straight from
+        the cursor. Use when the full merged set has to stay in memory."""
+        conn = self.get_connection()
+        conn.row_factory = sqlite3.Row
+        
+        try:
+            schools_query, salesnav_query, params = self._lead_queries(filters)
+            store = CompactLeadStore()
+            for row in conn.execute(schools_query, params):
+                store.add_schools_row(row)
+            for row in conn.execute(salesnav_query, params):
+                store.add_salesnav_row(row)
             
-            schools_leads = conn.execute(schools_query).fetchall()
-            salesnav_leads = conn.execute(salesnav_query).fetchall()
+            leads = store.records()
             
-            # Combine leads by UID
-            unique_leads = {}
+            # Apply filters
+            if filters:
+                leads = self._apply_filters(leads, filters)
+            
+            return leads
             
-            # Process schools leads
-            for row in schools_leads:
+        finally:
+            conn.close()
+    
+    def _lead_queries(self, filters: Optional[LeadsFilters]):
+        # Get all leads from both tables
+        schools_query = "SELECT *, 'schools' as source_table FROM leads_schools"
+        salesnav_query = "SELECT *, 'salesnav' as source_table FROM leads_salesnav"
+        params: List[Any] = []
+        
+        # Narrow both tables through the skill index before loading rows;
+        # a filter made only of blank values is ignored
+        skills = self._clean_skills(filters.skills) if filters and filters.skills else []
+        if skills:
+            skill_clause, params = self._skill_filter_clause(skills, filters.skillsMatch)
+            schools_query += f" WHERE uid IN ({skill_clause})"
+            salesnav_query += f" WHERE uid IN ({skill_clause})"
+        
+        return schools_query, salesnav_query, params
+    
+    def _merge_rows(self, schools_leads, salesnav_leads) -> Dict[str, Dict[str, Any]]:
+        # Combine leads by UID
+        unique_leads = {}
+        
+        # Process schools leads
+        for row in schools_leads:
+            lead_data = {
+                'uid': row['uid'],
+                'user_name': row['user_name'],
+                'title': row['title'],
+                'linkedin_profile_url': row['linkedin_profile_url'],
+                'linkedin_image_url': row['linkedin_image_url'],
+                'location': row['location'],
+                'req_school': row['req_school'],
+                'req_country': row['req_country'],
+                'timestamp': row['timestamp'],
+                'about': None,
+                'headline': None,
+                'skills': None,
+                'experience': None,
+                'source': LeadSource.SCHOOLS,
+                'slug': row['slug']
+            }
+            unique_leads[row['uid']] = lead_data
+        
+        # Process salesnav leads
+        for row in salesnav_leads:
+            if row['uid'] in unique_leads:
+                # Lead exists in both sources
+                existing = unique_leads[row['uid']]
+                existing.update({
+                    'about': row['about'],
+                    'headline': row['headline'],
+                    'skills': row['skills'],
+                    'experience': row['experience'],
+                    'source': LeadSource.BOTH
+                })
+            else:
+                # Lead only in salesnav
                 lead_data = {
                     'uid': row['uid'],
                     'user_name': row['user_name'],
@@ -36,59 +333,33 @@ class SQLiteDatabase:
                     'req_school': row['req_school'],
                     'req_country': row['req_country'],
                     'timestamp': row['timestamp'],
-                    'about': None,
-                    'headline': None,
-                    'skills': None,
-                    'experience': None,
-                    'source': LeadSource.SCHOOLS,
+                    'about': row['about'],
+                    'headline': row['headline'],
+                    'skills': row['skills'],
+                    'experience': row['experience'],
+                    'source': LeadSource.SALESNAV,
                     'slug': row['slug']
                 }
                 unique_leads[row['uid']] = lead_data
-            
-            # Process salesnav leads
-            for row in salesnav_leads:
-                if row['uid'] in unique_leads:
-                    # Lead exists in both sources
-                    existing = unique_leads[row['uid']]
-                    existing.update({
-                        'about': row['about'],
-                        'headline': row['headline'],
-                        'skills': row['skills'],
-                        'experience': row['experience'],
-                        'source': LeadSource.BOTH
-                    })
-                else:
-                    # Lead only in salesnav
-                    lead_data = {
-                        'uid': row['uid'],
-                        'user_name': row['user_name'],
-                        'title': row['title'],
-                        'linkedin_profile_url': row['linkedin_profile_url'],
-                        'linkedin_image_url': row['linkedin_image_url'],
-                        'location': row['location'],
-                        'req_school': row['req_school'],
-                        'req_country': row['req_country'],
-                        'timestamp': row['timestamp'],
-                        'about': row['about'],
-                        'headline': row['headline'],
-                        'skills': row['skills'],
-                        'experience': row['experience'],
-                        'source': LeadSource.SALESNAV,
-                        'slug': row['slug']
-                    }
-                    unique_leads[row['uid']] = lead_data
-            
-            # Convert to CombinedLead objects
-            leads = [CombinedLead(**lead_data) for lead_data in unique_leads.values()]
-            
-            # Apply filters
-            if filters:
-                leads = self._apply_filters(leads, filters)
-            
-            return leads
-            
-        finally:
-            conn.close()
+        
+        return unique_leads
+    
+    @staticmethod
+    def _clean_skills(skills: List[str]) -> List[str]:
+        return [skill.strip() for skill in skills if skill and skill.strip()]
+    
+    def _skill_filter_clause(self, skills: List[str], match: Optional[SkillMatch]):
+        placeholders = ", ".join("?" for _ in skills)
+        query = f"""
+            SELECT ls.uid FROM lead_skills ls
+            JOIN skills s ON s.id = ls.skill_id
+            WHERE s.name IN ({placeholders})
+        """
+        params: List[Any] = list(skills)
+        if match == SkillMatch.ALL:
+            query += " GROUP BY ls.uid HAVING COUNT(DISTINCT ls.skill_id) = ?"
+            params.append(len({skill.lower() for skill in skills}))
+        return query, params
     
     def _apply_filters(self, leads: List[CombinedLead], filters: LeadsFilters) -> List[CombinedLead]:
         filtered_leads = leads
@@ -140,11 +411,41 @@ class SQLiteDatabase:
         return filtered_leads
     
     def get_lead_by_uid(self, uid: str) -> Optional[CombinedLead]:
-        leads = self.get_leads()
-        return next((lead for lead in leads if lead.uid == uid), None)
+        _, lead = list(self.iter_leads_by_uids([uid]))[0]
+        return lead
+    
+    def iter_leads_by_uids(self, uids: List[str]) -> Iterator[Tuple[str, Optional[CombinedLead]]]:
+        """Yield (uid, lead) pairs in request order; lead is None for unknown uids.
+        
+        Lookups run as chunked ``WHERE uid IN (...)`` queries against both
+        tables, so only the requested rows are ever loaded. Each chunk opens
+        its own connection: when the generator is driven by a streaming
+        response, successive chunks may run on different worker threads.
+        """
+        for start in range(0, len(uids), self.UID_CHUNK_SIZE):
+            chunk = uids[start:start + self.UID_CHUNK_SIZE]
+            lookup = list(dict.fromkeys(chunk))
+            placeholders = ", ".join("?" for _ in lookup)
+            
+            conn = self.get_connection()
+            conn.row_factory = sqlite3.Row
+            try:
+                schools_leads = conn.execute(
+                    f"SELECT * FROM leads_schools WHERE uid IN ({placeholders})", lookup
+                ).fetchall()
+                salesnav_leads = conn.execute(
+                    f"SELECT * FROM leads_salesnav WHERE uid IN ({placeholders})", lookup
+                ).fetchall()
+            finally:
+                conn.close()
+            
+            unique_leads = self._merge_rows(schools_leads, salesnav_leads)
+            for uid in chunk:
+                lead_data = unique_leads.get(uid)
+                yield uid, CombinedLead(**lead_data) if lead_data else None
     
     def get_lead_stats(self) -> LeadStats:
-        leads = self.get_leads()
+        leads = self.get_leads_compact()
         schools_only = sum(1 for lead in leads if lead.source == LeadSource.SCHOOLS)
         salesnav_only = sum(1 for lead in leads if lead.source == LeadSource.SALESNAV)
         both = sum(1 for lead in leads if lead.source == LeadSource.BOTH)
@@ -186,4 +487,371 @@ class SQLiteDatabase:
             countries = conn.execute(query).fetchall()
             return [country[0] for country in countries]
         finally:
-            conn.close()
\ No newline at end of file
+            conn.close()
+    
+    def get_top_skills(self, limit: int = 50) -> List[SkillCount]:
+        conn = self.get_connection()
+        try:
+            query = """
+                SELECT s.name, COUNT(*) AS lead_count FROM lead_skills ls
+                JOIN skills s ON s.id = ls.skill_id
+                GROUP BY ls.skill_id
+                ORDER BY lead_count DESC, s.name
+                LIMIT ?
+            """
+            rows = conn.execute(query, (limit,)).fetchall()
+            return [SkillCount(skill=row[0], count=row[1]) for row in rows]
+        finally:
+            conn.close()
+    
+    def ensure_skill_index(self):
+        """Create the normalized skill and experience tables if missing"""
+        if "skill_index" in self._ensured:
+            return
+        conn = self.get_live_connection()
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS skills (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+                );
+                CREATE TABLE IF NOT EXISTS lead_skills (
+                    skill_id INTEGER NOT NULL REFERENCES skills(id),
+                    uid TEXT NOT NULL,
+                    PRIMARY KEY (skill_id, uid)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_lead_skills_uid ON lead_skills(uid);
+                CREATE TABLE IF NOT EXISTS lead_experience (
+                    uid TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    entry TEXT NOT NULL,
+                    PRIMARY KEY (uid, position)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS lead_profile_index (
+                    uid TEXT PRIMARY KEY,
+                    skills_raw TEXT,
+                    experience_raw TEXT
+                );
+            """)
+            self._ensured.add("skill_index")
+        finally:
+            conn.close()
+    
+    def sync_skill_index(self) -> int:
+        """Parse new or changed salesnav skills/experience into the index tables.
+        
+        Only rows whose raw text differs from what was indexed last time are
+        re-parsed, so this is cheap to run after every scraper batch.
+        Returns the number of leads (re)indexed.
+        
+        Changed rows are indexed UID_CHUNK_SIZE at a time, each chunk in its
+        own BEGIN IMMEDIATE transaction, so the live write lock is only held
+        briefly even on the first build. Each chunk is looked up read-only
+        first, so an idle sync never takes the write lock.
+        """
+        with self._sync_lock:
+            self.ensure_skill_index()
+            conn = self.get_live_connection()
+            try:
+                skill_ids = {
+                    self._skill_key(name): skill_id
+                    for skill_id, name in conn.execute("SELECT id, name FROM skills")
+                }
+                indexed = 0
+                last_rowid = 0
+                while conn.execute(self.CHANGED_PROFILES_QUERY, (last_rowid, 1)).fetchone():
+                    conn.execute("BEGIN IMMEDIATE")
+                    with conn:
+                        changed = conn.execute(
+                            self.CHANGED_PROFILES_QUERY, (last_rowid, self.UID_CHUNK_SIZE)
+                        ).fetchall()
+                        self._index_profiles(conn, changed, skill_ids)
+                    if not changed:
+                        break
+                    indexed += len(changed)
+                    last_rowid = changed[-1][0]
+                
+                # Drop index rows for leads removed from salesnav
+                removed = conn.execute("""
+                    SELECT 1 FROM lead_profile_index
+                    WHERE uid NOT IN (SELECT uid FROM leads_salesnav) LIMIT 1
+                """).fetchone()
+                if removed:
+                    conn.execute("BEGIN IMMEDIATE")
+                    with conn:
+                        for table in ("lead_skills", "lead_experience", "lead_profile_index"):
+                            conn.execute(f"""
+                                DELETE FROM {table}
+                                WHERE uid NOT IN (SELECT uid FROM leads_salesnav)
+                            """)
+                return indexed
+            finally:
+                conn.close()
+    
+    def _index_profiles(self, conn: sqlite3.Connection, changed, skill_ids: Dict[str, int]):
+        uids = [(uid,) for _, uid, _, _ in changed]
+        conn.executemany("DELETE FROM lead_skills WHERE uid = ?", uids)
+        conn.executemany("DELETE FROM lead_experience WHERE uid = ?", uids)
+        
+        lead_skills = []
+        experience = []
+        for _, uid, skills_raw, experience_raw in changed:
+            ids = dict.fromkeys(self._skill_id(conn, name, skill_ids) for name in self._split_field(skills_raw))
+            lead_skills.extend((skill_id, uid) for skill_id in ids)
+            experience.extend(
+                (uid, position, entry)
+                for position, entry in enumerate(self._split_field(experience_raw))
+            )
+        
+        conn.executemany("INSERT OR IGNORE INTO lead_skills (skill_id, uid) VALUES (?, ?)", lead_skills)
+        conn.executemany("INSERT INTO lead_experience (uid, position, entry) VALUES (?, ?, ?)", experience)
+        conn.executemany(
+            "INSERT OR REPLACE INTO lead_profile_index (uid, skills_raw, experience_raw) VALUES (?, ?, ?)",
+            [(uid, skills_raw, experience_raw) for _, uid, skills_raw, experience_raw in changed]
+        )
+    
+    def _skill_id(self, conn: sqlite3.Connection, name: str, skill_ids: Dict[str, int]) -> int:
+        """Intern a skill name, looking each one up in the database only once"""
+        key = self._skill_key(name)
+        skill_id = skill_ids.get(key)
+        if skill_id is None:
+            cursor = conn.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (name,))
+            if cursor.rowcount == 1:
+                skill_id = cursor.lastrowid
+            else:
+                skill_id = conn.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()[0]
+            skill_ids[key] = skill_id
+        return skill_id
+    
+    @classmethod
+    def _skill_key(cls, name: str) -> str:
+        # skills.name is COLLATE NOCASE, which only folds ASCII letters
+        return name.translate(cls.NOCASE)
+    
+    @staticmethod
+    def _split_field(value: Optional[str]) -> List[str]:
+        if not value:
+            return []
+        return [part.strip() for part in value.split(',') if part.strip()]
+    
+    def get_lead_timeseries(
+        self,
+        interval: TimeInterval = TimeInterval.DAY,
+        group_by: Optional[List[TimeseriesDimension]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        source: Optional[LeadSource] = None,
+        school: Optional[str] = None,
+        country: Optional[str] = None
+    ) -> List[TimeseriesPoint]:
+        """Lead counts per day or week, read from the daily rollup table.
+        
+        Read-only: the rollup is kept current by sync_lead_rollup(), which
+        the API runs in the background. school and country match as
+        case-insensitive substrings, like the /api/leads filters.
+        """
+        if interval == TimeInterval.WEEK:
+            # Monday of the week containing the day
+            period = "date(day, 'weekday 0', '-6 days')"
+        else:
+            period = "day"
+        columns = [self.TIMESERIES_COLUMNS[dimension] for dimension in dict.fromkeys(group_by or [])]
+        
+        conditions = []
+        params: List[Any] = []
+        for clause, value in (
+            ("day >= ?", start),
+            ("day <= ?", end),
+            ("source = ?", source.value if source else None),
+            ("instr(lower(req_school), lower(?)) > 0", school),
+            ("instr(lower(req_country), lower(?)) > 0", country),
+        ):
+            if value:
+                conditions.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        select = ", ".join([f"{period} AS period"] + columns)
+        group = ", ".join(["period"] + columns)
+        query = f"""
+            SELECT {select}, SUM(lead_count) AS lead_count FROM lead_daily_rollup
+            {where}
+            GROUP BY {group}
+            ORDER BY {group}
+        """
+        
+        conn = self.get_connection()
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(query, params).fetchall()
+            return [
+                TimeseriesPoint(
+                    period=row['period'],
+                    count=row['lead_count'],
+                    **{column: row[column] or None for column in columns}
+                )
+                for row in rows
+            ]
+        finally:
+            conn.close()
+    
+    def ensure_lead_rollup(self):
+        """Create the daily rollup tables if missing"""
+        if "lead_rollup" in self._ensured:
+            return
+        conn = self.get_live_connection()
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS lead_daily_rollup (
+                    day TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    req_school TEXT NOT NULL,
+                    req_country TEXT NOT NULL,
+                    lead_count INTEGER NOT NULL,
+                    PRIMARY KEY (day, source, req_school, req_country)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS lead_rollup_state (
+                    uid TEXT PRIMARY KEY,
+                    day TEXT,
+                    source TEXT NOT NULL,
+                    req_school TEXT NOT NULL,
+                    req_country TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS lead_rollup_watermark (
+                    table_name TEXT PRIMARY KEY,
+                    max_rowid INTEGER NOT NULL
+                );
+            """)
+            self._ensured.add("lead_rollup")
+        finally:
+            conn.close()
+    
+    def sync_lead_rollup(self) -> int:
+        """Fold rows added since the last sync into the daily rollup.
+        
+        Each table's rowid watermark limits the work to newly landed rows.
+        A lead's previous contribution is kept in lead_rollup_state, so a
+        schools lead that later shows up in salesnav moves from the
+        "schools" bucket to "both" instead of being counted twice.
+        Returns the number of leads whose rollup bucket changed.
+        
+        Rows are folded UID_CHUNK_SIZE at a time, each chunk in its own
+        BEGIN IMMEDIATE transaction that also advances the table's watermark.
+        The live write lock is only held briefly, an interrupted sync resumes
+        where it stopped, and overlapping syncs (in this process or another
+        worker) can't fold the same rows twice.
+        """
+        with self._sync_lock:
+            self.ensure_lead_rollup()
+            conn = self.get_live_connection()
+            conn.row_factory = sqlite3.Row
+            try:
+                changed = 0
+                # Only take the write lock for tables with rows past the watermark
+                for table in self._tables_with_new_rows(conn):
+                    while True:
+                        chunk_changed, more = self._sync_rollup_chunk(conn, table)
+                        changed += chunk_changed
+                        if not more:
+                            break
+                return changed
+            finally:
+                conn.close()
+    
+    @staticmethod
+    def _rollup_watermarks(conn: sqlite3.Connection) -> Dict[str, int]:
+        return {
+            row['table_name']: row['max_rowid']
+            for row in conn.execute("SELECT table_name, max_rowid FROM lead_rollup_watermark")
+        }
+    
+    def _tables_with_new_rows(self, conn: sqlite3.Connection) -> List[str]:
+        watermarks = self._rollup_watermarks(conn)
+        return [
+            table for table in ("leads_schools", "leads_salesnav")
+            if conn.execute(
+                f"SELECT 1 FROM {table} WHERE rowid > ? LIMIT 1", (watermarks.get(table, 0),)
+            ).fetchone()
+        ]
+    
+    def _sync_rollup_chunk(self, conn: sqlite3.Connection, table: str) -> Tuple[int, bool]:
+        """Fold the next chunk of table past its watermark; returns
+        (leads changed, whether more rows may remain)"""
+        conn.execute("BEGIN IMMEDIATE")
+        with conn:
+            watermark = self._rollup_watermarks(conn).get(table, 0)
+            rows = conn.execute(
+                f"SELECT rowid AS rowid, uid FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (watermark, self.UID_CHUNK_SIZE)
+            ).fetchall()
+            if not rows:
+                return 0, False
+            
+            uids = list(dict.fromkeys(row['uid'] for row in rows))
+            changed = self._fold_rollup_chunk(conn, uids)
+            conn.execute(
+                "INSERT OR REPLACE INTO lead_rollup_watermark (table_name, max_rowid) VALUES (?, ?)",
+                (table, rows[-1]['rowid'])
+            )
+        return changed, len(rows) == self.UID_CHUNK_SIZE
+    
+    def _fold_rollup_chunk(self, conn: sqlite3.Connection, uids: List[str]) -> int:
+        placeholders = ", ".join("?" for _ in uids)
+        schools_leads = conn.execute(
+            f"SELECT * FROM leads_schools WHERE uid IN ({placeholders})", uids
+        ).fetchall()
+        salesnav_leads = conn.execute(
+            f"SELECT * FROM leads_salesnav WHERE uid IN ({placeholders})", uids
+        ).fetchall()
+        unique_leads = self._merge_rows(schools_leads, salesnav_leads)
+        previous = {
+            row['uid']: (row['day'], row['source'], row['req_school'], row['req_country'])
+            for row in conn.execute(
+                f"SELECT * FROM lead_rollup_state WHERE uid IN ({placeholders})", uids
+            )
+        }
+        
+        changed = 0
+        for uid, lead_data in unique_leads.items():
+            bucket = (
+                self._rollup_day(lead_data['timestamp']),
+                lead_data['source'].value,
+                lead_data['req_school'] or '',
+                lead_data['req_country'] or '',
+            )
+            old_bucket = previous.get(uid)
+            if old_bucket == bucket:
+                continue
+            
+            if old_bucket and old_bucket[0]:
+                conn.execute("""
+                    UPDATE lead_daily_rollup SET lead_count = lead_count - 1
+                    WHERE day = ? AND source = ? AND req_school = ? AND req_country = ?
+                """, old_bucket)
+                conn.execute("""
+                    DELETE FROM lead_daily_rollup
+                    WHERE day = ? AND source = ? AND req_school = ? AND req_country = ?
+                      AND lead_count <= 0
+                """, old_bucket)
+            if bucket[0]:
+                conn.execute("""
+                    INSERT INTO lead_daily_rollup (day, source, req_school, req_country, lead_count)
+                    VALUES (?, ?, ?, ?, 1)
+                    ON CONFLICT (day, source, req_school, req_country)
+                    DO UPDATE SET lead_count = lead_count + 1
+                """, bucket)
+            conn.execute(
+                "INSERT OR REPLACE INTO lead_rollup_state (uid, day, source, req_school, req_country) VALUES (?, ?, ?, ?, ?)",
+                (uid,) + bucket
+            )
+            changed += 1
+        return changed
+    
+    @staticmethod
+    def _rollup_day(timestamp: Optional[str]) -> Optional[str]:
+        if not timestamp:
+            return None
+        try:
+            return datetime.fromisoformat(timestamp.strip()).date().isoformat()
+        except ValueError:
+            return None
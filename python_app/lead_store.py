@@ -0,0 +1,107 @@
+from typing import Dict, Iterator, List, Optional
+from models import CombinedLead, LeadSource
+
+# LeadSource is stored on each record as an index into this tuple
+SOURCES = (LeadSource.SCHOOLS, LeadSource.SALESNAV, LeadSource.BOTH)
+SOURCE_CODES = {source: code for code, source in enumerate(SOURCES)}
+
+class LeadRecord:
+    """Slotted stand-in for CombinedLead.
+    
+    Exposes the same attributes as CombinedLead, so it can be passed to the
+    existing filter and sort code, but carries no per-instance dict and keeps
+    the source as a small int.
+    """
+    __slots__ = (
+        'uid', 'user_name', 'title', 'linkedin_profile_url', 'linkedin_image_url',
+        'location', 'req_school', 'req_country', 'timestamp', 'about', 'headline',
+        'skills', 'experience', 'slug', '_source'
+    )
+    
+    FIELDS = (
+        'uid', 'user_name', 'title', 'linkedin_profile_url', 'linkedin_image_url',
+        'location', 'req_school', 'req_country', 'timestamp', 'about', 'headline',
+        'skills', 'experience', 'source', 'slug'
+    )
+    
+    @property
+    def source(self) -> LeadSource:
+        return SOURCES[self._source]
+    
+    @source.setter
+    def source(self, value: LeadSource):
+        self._source = SOURCE_CODES[LeadSource(value)]
+    
+    def model_dump(self) -> Dict[str, Optional[str]]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+    
+    def to_combined_lead(self) -> CombinedLead:
+        return CombinedLead(**self.model_dump())
+
+class CompactLeadStore:
+    """Merged leads held as LeadRecords with pooled categorical strings.
+    
+    Rows are folded in one at a time with the same merge rules as
+    SQLiteDatabase._merge_rows, so a full load never materializes an
+    intermediate dict or pydantic model per lead. req_school, req_country and
+    location repeat heavily across leads and are deduplicated through a
+    per-store pool, so every lead from the same school shares one string.
+    """
+    
+    def __init__(self):
+        self._records: Dict[str, LeadRecord] = {}
+        self._pool: Dict[str, str] = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __iter__(self) -> Iterator[LeadRecord]:
+        return iter(self._records.values())
+    
+    def records(self) -> List[LeadRecord]:
+        return list(self._records.values())
+    
+    def get(self, uid: str) -> Optional[LeadRecord]:
+        return self._records.get(uid)
+    
+    def _intern(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return self._pool.setdefault(value, value)
+    
+    def _new_record(self, row, source: LeadSource) -> LeadRecord:
+        record = LeadRecord()
+        record.uid = row['uid']
+        record.user_name = row['user_name']
+        record.title = row['title']
+        record.linkedin_profile_url = row['linkedin_profile_url']
+        record.linkedin_image_url = row['linkedin_image_url']
+        record.location = self._intern(row['location'])
+        record.req_school = self._intern(row['req_school'])
+        record.req_country = self._intern(row['req_country'])
+        record.timestamp = row['timestamp']
+        record.about = None
+        record.headline = None
+        record.skills = None
+        record.experience = None
+        record.slug = row['slug']
+        record._source = SOURCE_CODES[source]
+        return record
+    
+    def add_schools_row(self, row):
+        self._records[row['uid']] = self._new_record(row, LeadSource.SCHOOLS)
+    
+    def add_salesnav_row(self, row):
+        record = self._records.get(row['uid'])
+        if record is not None:
+            # Lead exists in both sources
+            record._source = SOURCE_CODES[LeadSource.BOTH]
+        else:
+            # Lead only in salesnav
+            record = self._new_record(row, LeadSource.SALESNAV)
+            self._records[row['uid']] = record
+        
+        record.about = row['about']
+        record.headline = row['headline']
+        record.skills = row['skills']
+        record.experience = row['experience']
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Literal
 from enum import Enum
 
@@ -17,6 +17,19 @@ class SortOrder(str, Enum):
     ASC = "asc"
     DESC = "desc"
 
+class SkillMatch(str, Enum):
+    ANY = "any"
+    ALL = "all"
+
+class TimeInterval(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+
+class TimeseriesDimension(str, Enum):
+    SOURCE = "source"
+    SCHOOL = "school"
+    COUNTRY = "country"
+
 class CombinedLead(BaseModel):
     uid: str
     user_name: Optional[str] = None
@@ -39,11 +52,41 @@ class LeadsFilters(BaseModel):
     school: Optional[str] = None
     country: Optional[str] = None
     source: Optional[LeadSource] = None
+    skills: Optional[List[str]] = None
+    skillsMatch: Optional[SkillMatch] = None
     sortBy: Optional[SortBy] = None
     sortOrder: Optional[SortOrder] = None
 
+class LeadBatchRequest(BaseModel):
+    uids: List[str] = Field(..., max_length=50000)
+
+class LeadBatchResponse(BaseModel):
+    leads: List[CombinedLead]
+    missing: List[str]
+
 class LeadStats(BaseModel):
     totalLeads: int
     schoolsOnly: int
     salesnavOnly: int
-    both: int
\ No newline at end of file
+    both: int
+
+class SkillCount(BaseModel):
+    skill: str
+    count: int
+
+class TimeseriesPoint(BaseModel):
+    period: str
+    source: Optional[LeadSource] = None
+    req_school: Optional[str] = None
+    req_country: Optional[str] = None
+    count: int
+
+class ReadinessStatus(BaseModel):
+    ready: bool
+    database: bool
+    skillIndex: bool
+    leadRollup: bool
+    snapshot: bool
+    dataVersion: Optional[str] = None
+    dataAgeSeconds: Optional[float] = None
+    error: Optional[str] = None
@@ -20,12 +20,26 @@ cd "$(dirname "$0")"
 python3 start_api.py &
 API_PID=$!
 
-# Wait for API to start
-sleep 3
+# Wait for the API to start listening. /api/ready answers 503 while the
+# first warm-up (skill index and rollup build) is still running, which can
+# take minutes on a large database, so any HTTP response counts as started.
+API_START_TIMEOUT=${API_START_TIMEOUT:-60}
+API_STARTED=0
+for _ in $(seq 1 $((API_START_TIMEOUT * 2))); do
+    STATUS=$(curl -s -o /dev/null -w "%{http_code}" http://localhost:8000/api/ready)
+    if [ "$STATUS" != "000" ]; then
+        API_STARTED=1
+        break
+    fi
+    sleep 0.5
+done
 
 # Check if API is running
-if curl -s http://localhost:8000/api/stats > /dev/null; then
+if [ "$API_STARTED" = "1" ]; then
     echo "✅ FastAPI backend started successfully"
+    if [ "$STATUS" != "200" ]; then
+        echo "⏳ Still warming up; check http://localhost:8000/api/ready"
+    fi
 else
     echo "❌ Failed to start FastAPI backend"
     kill $API_PID 2>/dev/null
@@ -1,13 +1,46 @@
 #!/usr/bin/env python3
 """
 Start the Streamlit frontend
+
+Pass --measure-startup to time how long Streamlit takes to answer its
+health check and how long a cold first run of app.py takes (Streamlit only
+executes the script once a session connects), print the results and exit.
+The first-run timing talks to the API, so start it first.
 """
 import subprocess
 import sys
 import os
+import time
+import urllib.request
+
+HEALTH_URL = "http://localhost:8501/_stcore/health"
+
+def wait_until_healthy(process: subprocess.Popen, timeout: float = 120.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline and process.poll() is None:
+        try:
+            with urllib.request.urlopen(HEALTH_URL, timeout=1) as response:
+                if response.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.05)
+    return False
+
+def measure_first_run(timeout: float = 120.0) -> float:
+    """Time importing Streamlit plus one full script run, as a new session would"""
+    started_at = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    app_test = AppTest.from_file(os.path.abspath("app.py"), default_timeout=timeout).run()
+    elapsed = time.perf_counter() - started_at
+    if app_test.exception:
+        raise RuntimeError(app_test.exception[0].message)
+    return elapsed
 
 def main():
-    print("🚀 Starting Streamlit frontend on http://localhost:8501")
+    measure = "--measure-startup" in sys.argv
+    if not measure:
+        print("🚀 Starting Streamlit frontend on http://localhost:8501")
     
     # Change to the python_app directory
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
@@ -23,7 +56,26 @@ def main():
         "--server.headless=true"
     ]
     
-    subprocess.run(cmd)
+    if not measure:
+        subprocess.run(cmd)
+        return
+    
+    started_at = time.perf_counter()
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    try:
+        healthy = wait_until_healthy(process)
+        elapsed = time.perf_counter() - started_at
+    finally:
+        process.terminate()
+        process.wait()
+    
+    if healthy:
+        print(f"healthy:   {elapsed:.3f}s")
+    else:
+        print(f"not healthy after {elapsed:.3f}s")
+        sys.exit(1)
+    
+    print(f"first run: {measure_first_run():.3f}s")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
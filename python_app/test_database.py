@@ -0,0 +1,131 @@
+import os
+import sqlite3
+
+import pytest
+
+from database import SQLiteDatabase
+from models import LeadSource, LeadsFilters, SkillMatch, TimeseriesDimension
+
+# Mirrors shared/schema.ts: an id INTEGER PRIMARY KEY and a unique uid
+SCHOOLS_SCHEMA = """
+    CREATE TABLE leads_schools (
+        id INTEGER PRIMARY KEY, slug TEXT, uid TEXT UNIQUE, user_name TEXT,
+        linkedin_profile_url TEXT, linkedin_image_url TEXT, title TEXT, location TEXT,
+        req_school TEXT, req_country TEXT, timestamp TEXT
+    )
+"""
+SALESNAV_SCHEMA = """
+    CREATE TABLE leads_salesnav (
+        id INTEGER PRIMARY KEY, slug TEXT, uid TEXT UNIQUE, user_name TEXT,
+        linkedin_profile_url TEXT, linkedin_image_url TEXT, title TEXT, location TEXT,
+        about TEXT, headline TEXT, skills TEXT, experience TEXT,
+        req_school TEXT, req_country TEXT, timestamp TEXT
+    )
+"""
+
+def add_school_lead(db_path, uid, timestamp, school="MIT", country="Italy"):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "INSERT INTO leads_schools (uid, timestamp, req_school, req_country) VALUES (?, ?, ?, ?)",
+            (uid, timestamp, school, country)
+        )
+    conn.close()
+
+def add_salesnav_lead(db_path, uid, timestamp, skills=None, school="MIT", country="Italy"):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "INSERT INTO leads_salesnav (uid, timestamp, skills, req_school, req_country) VALUES (?, ?, ?, ?, ?)",
+            (uid, timestamp, skills, school, country)
+        )
+    conn.close()
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "leads.db")
+    conn = sqlite3.connect(path)
+    conn.execute(SCHOOLS_SCHEMA)
+    conn.execute(SALESNAV_SCHEMA)
+    conn.close()
+    return path
+
+@pytest.fixture
+def db(db_path):
+    return SQLiteDatabase(db_path)
+
+def test_rollup_counts_leads_in_tables_with_integer_primary_key(db, db_path):
+    add_school_lead(db_path, "u1", "2024-01-01 10:00:00")
+    add_school_lead(db_path, "u2", "2024-01-02 10:00:00")
+    add_salesnav_lead(db_path, "u2", "2024-01-05 10:00:00")
+    add_salesnav_lead(db_path, "u3", "2024-01-03 10:00:00")
+
+    assert db.sync_lead_rollup() == 3
+    points = db.get_lead_timeseries(group_by=[TimeseriesDimension.SOURCE])
+    assert [(p.period, p.source, p.count) for p in points] == [
+        ("2024-01-01", LeadSource.SCHOOLS, 1),
+        ("2024-01-02", LeadSource.BOTH, 1),
+        ("2024-01-03", LeadSource.SALESNAV, 1),
+    ]
+
+def test_rollup_sync_only_folds_new_rows(db, db_path):
+    add_school_lead(db_path, "u1", "2024-01-01 10:00:00")
+    db.sync_lead_rollup()
+    assert db.sync_lead_rollup() == 0
+
+    add_salesnav_lead(db_path, "u1", "2024-01-01 10:00:00")
+    assert db.sync_lead_rollup() == 1
+    points = db.get_lead_timeseries(group_by=[TimeseriesDimension.SOURCE])
+    assert [(p.source, p.count) for p in points] == [(LeadSource.BOTH, 1)]
+
+def test_interrupted_rollup_sync_resumes_without_double_counting(db, db_path, monkeypatch):
+    for i in range(7):
+        add_school_lead(db_path, f"u{i}", "2024-01-01 10:00:00")
+    db.UID_CHUNK_SIZE = 3
+
+    fold = db._fold_rollup_chunk
+    calls = []
+    def fail_on_second_chunk(conn, uids):
+        calls.append(uids)
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("database is locked")
+        return fold(conn, uids)
+    monkeypatch.setattr(db, "_fold_rollup_chunk", fail_on_second_chunk)
+
+    with pytest.raises(sqlite3.OperationalError):
+        db.sync_lead_rollup()
+    monkeypatch.setattr(db, "_fold_rollup_chunk", fold)
+
+    assert db.sync_lead_rollup() == 4
+    assert sum(p.count for p in db.get_lead_timeseries()) == 7
+
+def test_skill_index_interns_skills_across_chunks(db, db_path):
+    add_salesnav_lead(db_path, "u1", "2024-01-01", skills="Python, SQL")
+    add_salesnav_lead(db_path, "u2", "2024-01-01", skills="python,Go, ")
+    add_salesnav_lead(db_path, "u3", "2024-01-01", skills="SQL")
+    db.UID_CHUNK_SIZE = 2
+
+    assert db.sync_skill_index() == 3
+    assert db.sync_skill_index() == 0
+    assert [(s.skill, s.count) for s in db.get_top_skills()] == [("Python", 2), ("SQL", 2), ("Go", 1)]
+
+    filters = LeadsFilters(skills=["PYTHON", "sql"], skillsMatch=SkillMatch.ALL)
+    assert [lead.uid for lead in db.get_leads(filters)] == ["u1"]
+    assert len(db.get_leads(LeadsFilters(skills=[" "]))) == 3
+
+def test_pinned_snapshot_is_not_pruned_until_released(db_path, tmp_path):
+    db = SQLiteDatabase(db_path, snapshot_dir=str(tmp_path / "snapshots"))
+    db.SNAPSHOTS_TO_KEEP = 1
+    db.refresh_snapshot()
+    pinned = db.acquire_snapshot()
+
+    for i in range(3):
+        add_school_lead(db_path, f"u{i}", "2024-01-01")
+        db.refresh_snapshot()
+    assert os.path.exists(pinned.path)
+    with db.pinned_snapshot(pinned):
+        assert db.get_lead_stats().totalLeads == 0
+
+    db.release_snapshot(pinned)
+    assert not os.path.exists(pinned.path)
+    assert db.get_lead_stats().totalLeads == 3